@@ -5,10 +5,17 @@ Rigorous mathematical verification of Bitcoin's supply schedule and inflation ra
 """
 
 import math
+import os
+import sys
 from datetime import datetime, timedelta
 from typing import List, Tuple, Dict
 import json
 
+# Time constants (Julian year, 10-minute blocks)
+DAYS_PER_YEAR = 365.25
+SECONDS_PER_YEAR = DAYS_PER_YEAR * 24 * 60 * 60  # 31557600.0
+BLOCKS_PER_YEAR = DAYS_PER_YEAR * 24 * 60 / 10  # 52596.0
+
 
 class BitcoinTokenomics:
     """
@@ -17,29 +24,45 @@ class BitcoinTokenomics:
 
     # Protocol constants
     INITIAL_REWARD = 50.0  # BTC per block
+    INITIAL_REWARD_SATS = 5_000_000_000  # satoshis per block (50 BTC)
     HALVING_INTERVAL = 210_000  # blocks
     TARGET_BLOCK_TIME = 10 * 60  # seconds (10 minutes)
     SATOSHIS_PER_BTC = 100_000_000
     GENESIS_DATE = datetime(2009, 1, 3)  # Genesis block date
 
-    def __init__(self):
-        self.total_halvings = self._calculate_total_halvings()
+    # Halvings until the reward drops below 1 satoshi. Halving n satoshis
+    # until they drop below 1 takes exactly as many steps as n has bits.
+    total_halvings = INITIAL_REWARD_SATS.bit_length()
 
-    def _calculate_total_halvings(self) -> int:
+    def __init__(self):
+        # Per-epoch tables cover the epochs halving_schedule lists, 0..total_halvings
+        n_epochs = self.total_halvings + 1
+        # Block reward for each epoch
+        self._reward_by_epoch = tuple(self.INITIAL_REWARD * 0.5 ** e for e in range(n_epochs))
+        # Derived constants, computed once rather than on every call
+        self._total_supply_sats = self._supply_sats(self.total_halvings)
+        self._total_supply = self._total_supply_sats / self.SATOSHIS_PER_BTC
+        # Cumulative supply at the start of each epoch, i.e. at every halving height
+        self._supply_at_epoch = tuple(self._supply_sats(e) / self.SATOSHIS_PER_BTC
+                                      for e in range(n_epochs))
+        # time_to_percentage results, keyed by percentage
+        self._time_to_percentage_cache = {}
+
+    def _supply_sats(self, epoch: int, remainder: int = 0) -> int:
         """
-        Calculate the total number of halvings until reward < 1 satoshi.
+        Cumulative supply in satoshis after full epochs plus a partial one.
+
+        Args:
+            epoch: Number of completed halving epochs
+            remainder: Blocks mined so far in the following epoch
 
         Returns:
-            Number of halvings
+            Supply in satoshis, rounded down
         """
-        reward_satoshis = self.INITIAL_REWARD * self.SATOSHIS_PER_BTC
-        halvings = 0
-
-        while reward_satoshis >= 1:
-            reward_satoshis /= 2
-            halvings += 1
-
-        return halvings
+        # 2 * R * H * (1 - 2^-k) + r * R * 2^-k, scaled by 2^k so that the
+        # whole sum stays in exact integer arithmetic until the final shift.
+        return (self.INITIAL_REWARD_SATS *
+                (2 * self.HALVING_INTERVAL * ((1 << epoch) - 1) + remainder)) >> epoch
 
     def total_supply(self) -> float:
         """
@@ -49,9 +72,23 @@ class BitcoinTokenomics:
             Total supply in BTC
         """
         # Sum of geometric series: a * (1 - r^n) / (1 - r)
-        # where a = initial term, r = ratio (0.5), n = number of terms
-        supply = self.INITIAL_REWARD * self.HALVING_INTERVAL * (1 - (0.5 ** self.total_halvings)) / (1 - 0.5)
-        return supply
+        # where a = initial term, r = ratio (0.5), n = number of terms.
+        # Precomputed in __init__ in whole satoshis.
+        return self._total_supply
+
+    def block_reward(self, epoch: int) -> float:
+        """
+        Block reward during a given halving epoch.
+
+        Args:
+            epoch: Halving epoch number
+
+        Returns:
+            Block reward in BTC
+        """
+        if epoch < len(self._reward_by_epoch):
+            return self._reward_by_epoch[epoch]
+        return self.INITIAL_REWARD * 0.5 ** epoch
 
     def supply_at_block(self, block_height: int) -> float:
         """
@@ -63,18 +100,12 @@ class BitcoinTokenomics:
         Returns:
             Cumulative supply in BTC
         """
-        supply = 0.0
-        blocks_processed = 0
-        epoch = 0
-
-        while blocks_processed < block_height:
-            blocks_in_epoch = min(self.HALVING_INTERVAL, block_height - blocks_processed)
-            reward = self.INITIAL_REWARD / (2 ** epoch)
-            supply += blocks_in_epoch * reward
-            blocks_processed += blocks_in_epoch
-            epoch += 1
+        assert block_height >= 0, "block_height must be non-negative"
 
-        return supply
+        # Full epochs form a geometric series; the remainder is mined at the
+        # reward of the current epoch.
+        epoch, remainder = divmod(block_height, self.HALVING_INTERVAL)
+        return self._supply_sats(epoch, remainder) / self.SATOSHIS_PER_BTC
 
     def blocks_to_percentage(self, percentage: float) -> Tuple[int, float]:
         """
@@ -86,29 +117,31 @@ class BitcoinTokenomics:
         Returns:
             Tuple of (blocks, exact_percentage)
         """
-        target_supply = self.total_supply() * (percentage / 100)
-
-        blocks = 0
-        cumulative_supply = 0.0
-        epoch = 0
-
-        while cumulative_supply < target_supply:
-            reward = self.INITIAL_REWARD / (2 ** epoch)
-            remaining_supply = target_supply - cumulative_supply
-
-            if remaining_supply >= self.HALVING_INTERVAL * reward:
-                # Full epoch
-                blocks += self.HALVING_INTERVAL
-                cumulative_supply += self.HALVING_INTERVAL * reward
-                epoch += 1
-            else:
-                # Partial epoch
-                blocks_needed = int(remaining_supply / reward)
-                blocks += blocks_needed
-                cumulative_supply += blocks_needed * reward
-                break
-
-        exact_percentage = (cumulative_supply / self.total_supply()) * 100
+        if percentage <= 0 or math.isnan(percentage):
+            # NaN matches no supply; report it as nothing mined
+            return 0, 0.0
+        if percentage >= 100:
+            # The whole schedule; -log2(1 - frac) below has no finite answer here
+            return self.total_halvings * self.HALVING_INTERVAL, 100.0
+
+        target_sats = int(self._total_supply_sats * (percentage / 100))
+
+        # Supply after k full epochs is series_limit * (1 - 0.5^k), so the
+        # number of completed epochs can be solved for directly.
+        series_limit = self.INITIAL_REWARD_SATS * self.HALVING_INTERVAL * 2
+        full_epochs = int(math.floor(-math.log2(1 - target_sats / series_limit)))
+
+        # Partial epoch: the most blocks whose supply (see _supply_sats) does
+        # not exceed the target, solved exactly in integers. Clamping absorbs
+        # an off-by-one epoch from the float log2 right at a halving.
+        full_supply_scaled = series_limit * ((1 << full_epochs) - 1)
+        blocks_needed = (((target_sats + 1) << full_epochs) - full_supply_scaled - 1) // self.INITIAL_REWARD_SATS
+        blocks_needed = min(max(blocks_needed, 0), self.HALVING_INTERVAL)
+
+        blocks = full_epochs * self.HALVING_INTERVAL + blocks_needed
+        cumulative_sats = self._supply_sats(full_epochs, blocks_needed)
+
+        exact_percentage = (cumulative_sats / self._total_supply_sats) * 100
         return blocks, exact_percentage
 
     def time_to_percentage(self, percentage: float) -> Dict[str, any]:
@@ -121,24 +154,30 @@ class BitcoinTokenomics:
         Returns:
             Dictionary with blocks, time, and date
         """
+        cached = self._time_to_percentage_cache.get(percentage)
+        if cached is not None:
+            return dict(cached)
+
         blocks, exact_pct = self.blocks_to_percentage(percentage)
 
         total_seconds = blocks * self.TARGET_BLOCK_TIME
         time_delta = timedelta(seconds=total_seconds)
         target_date = self.GENESIS_DATE + time_delta
 
-        years = time_delta.days / 365.25
+        years = time_delta.days / DAYS_PER_YEAR
 
-        return {
+        result = {
             'target_percentage': percentage,
             'exact_percentage': exact_pct,
             'blocks': blocks,
             'seconds': total_seconds,
             'days': time_delta.days,
             'years': years,
-            'target_date': target_date.strftime('%Y-%m-%d'),
+            'target_date': target_date.date().isoformat(),
             'supply_btc': self.supply_at_block(blocks)
         }
+        self._time_to_percentage_cache[percentage] = result
+        return dict(result)
 
     def halving_schedule(self) -> List[Dict[str, any]]:
         """
@@ -147,40 +186,49 @@ class BitcoinTokenomics:
         Returns:
             List of halving events with details
         """
-        schedule = []
-
-        for epoch in range(self.total_halvings + 1):
-            block_height = epoch * self.HALVING_INTERVAL
-            reward = self.INITIAL_REWARD / (2 ** epoch)
-            cumulative_supply = self.supply_at_block(block_height)
-
-            # Calculate inflation rate at start of epoch
-            if cumulative_supply > 0:
-                annual_issuance = (365.25 * 24 * 60 / 10) * reward
-                inflation_rate = (annual_issuance / cumulative_supply) * 100
-            else:
-                inflation_rate = float('inf')
-
-            # Calculate date
-            total_seconds = block_height * self.TARGET_BLOCK_TIME
-            date = self.GENESIS_DATE + timedelta(seconds=total_seconds)
-            years_from_genesis = total_seconds / (365.25 * 24 * 60 * 60)
-
-            schedule.append({
+        # Constants read inside the per-row comprehensions, bound to locals
+        halving_interval = self.HALVING_INTERVAL
+        block_time = self.TARGET_BLOCK_TIME
+        satoshis_per_btc = self.SATOSHIS_PER_BTC
+        total_supply = self._total_supply
+        n_epochs = self.total_halvings + 1
+
+        # Every column is a closed-form function of the epoch, so build each
+        # one in a single pass instead of calling supply_at_block per row.
+        epochs = range(n_epochs)
+        block_heights = [epoch * halving_interval for epoch in epochs]
+        rewards = self._reward_by_epoch
+        cumulative = self._supply_at_epoch
+        annual = [BLOCKS_PER_YEAR * reward for reward in rewards]
+
+        # Inflation rate at start of epoch
+        inflation = [(issuance / supply) * 100 if supply > 0 else float('inf')
+                     for issuance, supply in zip(annual, cumulative)]
+
+        # Halvings are evenly spaced in time, so step the date by a fixed span.
+        # date.isoformat() is far cheaper than strftime('%Y-%m-%d').
+        seconds = [block_height * block_time for block_height in block_heights]
+        genesis = self.GENESIS_DATE
+        epoch_span = timedelta(seconds=halving_interval * block_time)
+        dates = [(genesis + epoch * epoch_span).date() for epoch in epochs]
+
+        return [
+            {
                 'halving': epoch,
                 'year': date.year,
-                'date': date.strftime('%Y-%m-%d'),
-                'years_from_genesis': round(years_from_genesis, 2),
+                'date': date.isoformat(),
+                'years_from_genesis': round(total_seconds / SECONDS_PER_YEAR, 2),
                 'block_height': block_height,
                 'reward_btc': reward,
-                'reward_satoshis': reward * self.SATOSHIS_PER_BTC,
-                'annual_issuance_btc': round((365.25 * 24 * 60 / 10) * reward, 2),
+                'reward_satoshis': reward * satoshis_per_btc,
+                'annual_issuance_btc': round(annual_issuance, 2),
                 'cumulative_supply_btc': round(cumulative_supply, 2),
-                'supply_percentage': round((cumulative_supply / self.total_supply()) * 100, 4),
+                'supply_percentage': round((cumulative_supply / total_supply) * 100, 4),
                 'inflation_rate_percent': round(inflation_rate, 4) if inflation_rate != float('inf') else 'N/A'
-            })
-
-        return schedule
+            }
+            for epoch, block_height, reward, cumulative_supply, annual_issuance, inflation_rate, total_seconds, date
+            in zip(epochs, block_heights, rewards, cumulative, annual, inflation, seconds, dates)
+        ]
 
     def inflation_rate_at_epoch(self, epoch: int, use_end_supply: bool = False) -> float:
         """
@@ -193,14 +241,11 @@ class BitcoinTokenomics:
         Returns:
             Annual inflation rate as percentage
         """
-        if use_end_supply:
-            block_height = (epoch + 1) * self.HALVING_INTERVAL
-        else:
-            block_height = epoch * self.HALVING_INTERVAL
+        boundary = epoch + 1 if use_end_supply else epoch
 
-        existing_supply = self.supply_at_block(block_height)
-        reward = self.INITIAL_REWARD / (2 ** epoch)
-        annual_issuance = (365.25 * 24 * 60 / 10) * reward
+        # Supply at an epoch boundary is the closed-form geometric sum; zero at genesis
+        existing_supply = self._supply_sats(boundary) / self.SATOSHIS_PER_BTC
+        annual_issuance = BLOCKS_PER_YEAR * self.block_reward(epoch)
 
         if existing_supply == 0:
             return float('inf')
@@ -227,11 +272,23 @@ class BitcoinTokenomics:
         }
 
 
+# Row templates for the halving schedule table, formatted with str.format_map
+SCHEDULE_HEADER = (f"{'Epoch':<6} {'Year':<6} {'Block Height':<15} {'Reward (BTC)':<15} "
+                   f"{'Annual Issuance':<18} {'Supply %':<12} {'Inflation %':<15}")
+SCHEDULE_ROW = ("{halving:<6} {year:<6} {block_height:<15,} {reward_btc:<15.8f} "
+                "{annual_issuance_btc:<18,} {supply_percentage:<12.4f} {inflation_rate_percent!s:<15}")
+SCHEDULE_TAIL_ROW = ("{halving:<6} {year:<6} {block_height:<15,} {reward_btc:<15.10f} "
+                     "{annual_issuance_btc:<18,} {supply_percentage:<12.4f} {inflation_rate_percent!s:<15}")
+
+
+def write_lines(lines: List[str]):
+    """Write a block of output lines to stdout in one call."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
 def print_section(title: str):
     """Pretty print section headers."""
-    print(f"\n{'='*80}")
-    print(f"{title.center(80)}")
-    print(f"{'='*80}\n")
+    sys.stdout.write(f"\n{'='*80}\n{title:^80}\n{'='*80}\n\n")
 
 
 def main():
@@ -256,43 +313,41 @@ def main():
 
     milestones = [50, 75, 90, 95, 99, 99.9, 99.99]
 
-    for pct in milestones:
-        result = btc.time_to_percentage(pct)
-        print(f"\n{pct}% of supply ({result['supply_btc']:,.2f} BTC):")
-        print(f"  Blocks needed: {result['blocks']:,}")
-        print(f"  Time: {result['years']:.2f} years ({result['days']:,} days)")
-        print(f"  Target date: {result['target_date']}")
-        print(f"  Exact percentage: {result['exact_percentage']:.6f}%")
+    milestone_results = {pct: btc.time_to_percentage(pct) for pct in milestones}
+
+    lines = []
+    for pct, result in milestone_results.items():
+        lines += [
+            f"\n{pct}% of supply ({result['supply_btc']:,.2f} BTC):",
+            f"  Blocks needed: {result['blocks']:,}",
+            f"  Time: {result['years']:.2f} years ({result['days']:,} days)",
+            f"  Target date: {result['target_date']}",
+            f"  Exact percentage: {result['exact_percentage']:.6f}%",
+        ]
+    write_lines(lines)
 
     # 3. Halving Schedule
     print_section("HALVING SCHEDULE (First 10 + Last 5)")
 
     schedule = btc.halving_schedule()
 
-    # Print header
-    print(f"{'Epoch':<6} {'Year':<6} {'Block Height':<15} {'Reward (BTC)':<15} "
-          f"{'Annual Issuance':<18} {'Supply %':<12} {'Inflation %':<15}")
-    print("-" * 110)
+    lines = [SCHEDULE_HEADER, "-" * 110]
 
     # First 10 halvings
-    for event in schedule[:10]:
-        print(f"{event['halving']:<6} {event['year']:<6} {event['block_height']:<15,} "
-              f"{event['reward_btc']:<15.8f} {event['annual_issuance_btc']:<18,} "
-              f"{event['supply_percentage']:<12.4f} {str(event['inflation_rate_percent']):<15}")
+    lines += [SCHEDULE_ROW.format_map(event) for event in schedule[:10]]
 
-    print("...")
+    lines.append("...")
 
     # Last 5 halvings
-    for event in schedule[-5:]:
-        print(f"{event['halving']:<6} {event['year']:<6} {event['block_height']:<15,} "
-              f"{event['reward_btc']:<15.10f} {event['annual_issuance_btc']:<18,} "
-              f"{event['supply_percentage']:<12.4f} {str(event['inflation_rate_percent']):<15}")
+    lines += [SCHEDULE_TAIL_ROW.format_map(event) for event in schedule[-5:]]
+
+    write_lines(lines)
 
     # 4. Inflation Rates by Epoch
     print_section("INFLATION RATES BY EPOCH (Detailed)")
 
-    print(f"{'Epoch':<8} {'Period':<15} {'Start Inflation %':<20} {'End Inflation %':<20}")
-    print("-" * 70)
+    lines = [f"{'Epoch':<8} {'Period':<15} {'Start Inflation %':<20} {'End Inflation %':<20}",
+             "-" * 70]
 
     for epoch in range(min(10, btc.total_halvings)):
         start_year = 2009 + (epoch * 4)
@@ -303,7 +358,9 @@ def main():
         start_str = f"{start_inflation:.4f}" if start_inflation != float('inf') else "∞"
         end_str = f"{end_inflation:.4f}" if end_inflation != float('inf') else "∞"
 
-        print(f"{epoch:<8} {start_year}-{end_year:<8} {start_str:<20} {end_str:<20}")
+        lines.append(f"{epoch:<8} {start_year}-{end_year:<8} {start_str:<20} {end_str:<20}")
+
+    write_lines(lines)
 
     # 5. Comparative Analysis
     print_section("COMPARATIVE ANALYSIS (2024)")
@@ -320,20 +377,22 @@ def main():
     # 6. Security Budget Analysis
     print_section("SECURITY BUDGET PROJECTION")
 
-    print(f"{'Epoch':<8} {'Year':<8} {'Block Reward':<15} {'Annual Issuance':<18} "
-          f"{'Value @ $100k':<20}")
-    print("-" * 75)
+    lines = [f"{'Epoch':<8} {'Year':<8} {'Block Reward':<15} {'Annual Issuance':<18} "
+             f"{'Value @ $100k':<20}",
+             "-" * 75]
 
     btc_price = 100_000  # Assume $100k BTC
 
     for epoch in [4, 5, 6, 7, 8, 10, 15, 20]:
         year = 2009 + (epoch * 4)
-        reward = btc.INITIAL_REWARD / (2 ** epoch)
-        annual_issuance = (365.25 * 24 * 60 / 10) * reward
+        reward = btc.block_reward(epoch)
+        annual_issuance = BLOCKS_PER_YEAR * reward
         value_usd = annual_issuance * btc_price
 
-        print(f"{epoch:<8} {year:<8} {reward:<15.8f} {annual_issuance:<18,.2f} "
-              f"${value_usd:<19,.0f}")
+        lines.append(f"{epoch:<8} {year:<8} {reward:<15.8f} {annual_issuance:<18,.2f} "
+                     f"${value_usd:<19,.0f}")
+
+    write_lines(lines)
 
     print("\nNote: Security budget must transition to transaction fees as block rewards diminish.")
 
@@ -347,14 +406,14 @@ def main():
             'genesis_date': btc.GENESIS_DATE.isoformat(),
             'calculation_date': datetime.now().isoformat()
         },
-        'milestones': {f"{pct}%": btc.time_to_percentage(pct) for pct in milestones},
+        'milestones': {f"{pct}%": result for pct, result in milestone_results.items()},
         'halving_schedule': schedule,
         'comparative_analysis': comparison
     }
 
-    output_file = '/Users/z/work/lux/ai/bitcoin_tokenomics_data.json'
+    output_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bitcoin_tokenomics_data.json')
     with open(output_file, 'w') as f:
-        json.dump(output_data, f, indent=2, default=str)
+        json.dump(output_data, f, separators=(',', ':'), default=str)
 
     print(f"Data exported to: {output_file}")
 
@@ -367,9 +426,11 @@ def main():
     print(f"Expected (50%): {btc.total_supply() / 2:,.2f} BTC")
     print(f"Match: {abs(supply_at_first_halving - btc.total_supply() / 2) < 0.01}")
 
-    # Verify geometric series
-    manual_sum = sum(btc.INITIAL_REWARD * btc.HALVING_INTERVAL / (2 ** i)
-                     for i in range(btc.total_halvings))
+    # Verify geometric series (fsum keeps the 33 shrinking terms exact). The
+    # formula total is floored to whole satoshis, so floor the sum the same way.
+    manual_sum = math.floor(math.fsum(btc.block_reward(i) * btc.HALVING_INTERVAL
+                                      for i in range(btc.total_halvings))
+                            * btc.SATOSHIS_PER_BTC) / btc.SATOSHIS_PER_BTC
     print(f"\nGeometric series sum: {manual_sum:,.8f} BTC")
     print(f"Formula result: {btc.total_supply():,.8f} BTC")
     print(f"Difference: {abs(manual_sum - btc.total_supply()):.10f} BTC")
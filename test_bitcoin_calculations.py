@@ -11,9 +11,10 @@ from bitcoin_tokenomics_calculator import BitcoinTokenomics
 class TestBitcoinTokenomics(unittest.TestCase):
     """Test suite for Bitcoin tokenomics calculations."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.btc = BitcoinTokenomics()
+    @classmethod
+    def setUpClass(cls):
+        """Set up a shared calculator; no test mutates it."""
+        cls.btc = BitcoinTokenomics()
 
     def test_total_supply_near_21_million(self):
         """Test that total supply is approximately 21M BTC."""
@@ -59,7 +60,7 @@ class TestBitcoinTokenomics(unittest.TestCase):
         """Test that manual sum equals formula calculation."""
         # Manual geometric series sum
         manual_sum = sum(
-            self.btc.INITIAL_REWARD * self.btc.HALVING_INTERVAL / (2 ** i)
+            self.btc.INITIAL_REWARD * self.btc.HALVING_INTERVAL / (1 << i)
             for i in range(self.btc.total_halvings)
         )
 
@@ -98,7 +99,7 @@ class TestBitcoinTokenomics(unittest.TestCase):
 
     def test_reward_less_than_satoshi_at_epoch_33(self):
         """Test that reward at epoch 33 is less than 1 satoshi."""
-        reward_btc = self.btc.INITIAL_REWARD / (2 ** 33)
+        reward_btc = self.btc.INITIAL_REWARD / (1 << 33)
         reward_satoshis = reward_btc * self.btc.SATOSHIS_PER_BTC
 
         self.assertLess(reward_satoshis, 1)
@@ -157,6 +158,55 @@ class TestBitcoinTokenomics(unittest.TestCase):
         self.assertEqual(satoshi_in_btc, 0.00000001)
         print(f"✓ Satoshi precision: {satoshi_in_btc:.8f} BTC")
 
+    def test_time_to_percentage_returns_copies(self):
+        """Test that mutating a returned result does not change later calls."""
+        # Own instance, so a leak into the cache cannot affect other tests
+        btc = BitcoinTokenomics()
+        computed = btc.time_to_percentage(75)  # computed and cached
+        expected = dict(computed)
+        computed.clear()
+        self.assertEqual(btc.time_to_percentage(75), expected)
+
+        cached = btc.time_to_percentage(75)  # served from the cache
+        cached['blocks'] = -1
+        self.assertEqual(btc.time_to_percentage(75), expected)
+
+        print(f"✓ time_to_percentage returns copies: 75% at block {expected['blocks']:,}")
+
+    def test_blocks_to_percentage_out_of_range(self):
+        """Test percentages at or beyond 0% and 100%, and NaN."""
+        max_blocks = self.btc.total_halvings * self.btc.HALVING_INTERVAL
+        for percentage in (0, -5.0, float('nan')):
+            self.assertEqual(self.btc.blocks_to_percentage(percentage), (0, 0.0))
+        for percentage in (100, 150.0):
+            self.assertEqual(self.btc.blocks_to_percentage(percentage), (max_blocks, 100.0))
+        print(f"✓ Out of range: 0% -> 0 blocks, 100% -> {max_blocks:,} blocks")
+
+    def test_blocks_to_percentage_is_tightest(self):
+        """Test supply(blocks) <= target < supply(blocks + 1) across 0-100%."""
+        sats = self.btc.SATOSHIS_PER_BTC
+        total_sats = round(self.btc.total_supply() * sats)
+        interval = self.btc.HALVING_INTERVAL
+
+        # Exact halving boundaries, where the float log2 is most fragile,
+        # targets on and one satoshi below sampled blocks, and a sweep
+        percentages = [self.btc.supply_at_block(k * interval) / self.btc.total_supply() * 100
+                       for k in range(1, self.btc.total_halvings)]
+        for block in range(1, 8 * interval, 7_919):
+            block_sats = round(self.btc.supply_at_block(block) * sats)
+            percentages += [block_sats / total_sats * 100, (block_sats - 1) / total_sats * 100]
+        percentages += [i / 100 for i in range(1, 10_000)]
+
+        for percentage in percentages:
+            blocks, _ = self.btc.blocks_to_percentage(percentage)
+            target_sats = int(total_sats * (percentage / 100))
+            self.assertLessEqual(round(self.btc.supply_at_block(blocks) * sats), target_sats,
+                                 f"overshoot at {percentage!r}%")
+            self.assertLess(target_sats, round(self.btc.supply_at_block(blocks + 1) * sats),
+                            f"not tightest at {percentage!r}%")
+
+        print(f"✓ blocks_to_percentage tightest for {len(percentages):,} percentages")
+
 
 def run_tests_with_output():
     """Run tests and print results."""
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the visualization data loaders
+Verify the schedule cache and the JSON parser fallback
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import visualize_bitcoin_tokenomics as viz
+
+
+SCHEDULE = [
+    {'halving': 0, 'years_from_genesis': 0.0, 'reward_btc': 50.0,
+     'cumulative_supply_btc': 0.0, 'annual_issuance_btc': 2629800.0,
+     'inflation_rate_percent': 'N/A'},
+    {'halving': 1, 'years_from_genesis': 4.0, 'reward_btc': 25.0,
+     'cumulative_supply_btc': 10500000.0, 'annual_issuance_btc': 1314900.0,
+     'inflation_rate_percent': 12.52},
+]
+
+
+class TestScheduleLoading(unittest.TestCase):
+    """Test suite for load_data and the load_schedule .npy cache."""
+
+    def setUp(self):
+        """Write a small schedule JSON into a fresh directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'data.json')
+        self.cache = os.path.join(self.tmp.name, 'data.npy')
+        with open(self.path, 'w') as f:
+            json.dump({'halving_schedule': SCHEDULE}, f)
+
+    def assertSchedule(self, arr):
+        """Check arr holds SCHEDULE in SCHEDULE_DTYPE."""
+        self.assertEqual(arr.dtype, np.dtype(viz.SCHEDULE_DTYPE))
+        self.assertEqual(list(arr['halving']), [0, 1])
+        self.assertEqual(list(arr['supply']), [0.0, 10500000.0])
+        self.assertTrue(np.isnan(arr['inflation'][0]))
+        self.assertEqual(arr['inflation'][1], 12.52)
+
+    def test_cache_miss_writes_cache(self):
+        """Test that the first load parses the JSON and writes the cache."""
+        arr = viz.load_schedule(self.path)
+        self.assertSchedule(arr)
+        self.assertFalse(isinstance(arr, np.memmap))
+        self.assertTrue(os.path.exists(self.cache))
+        self.assertFalse(os.path.exists(self.cache + '.tmp'))
+        print("✓ Cache miss: parsed JSON and wrote .npy cache")
+
+    def test_cache_hit_is_memory_mapped(self):
+        """Test that a fresh cache is memory-mapped without parsing JSON."""
+        viz.load_schedule(self.path)
+        with mock.patch.object(viz, 'load_data') as load_data:
+            arr = viz.load_schedule(self.path)
+        load_data.assert_not_called()
+        self.assertIsInstance(arr, np.memmap)
+        self.assertSchedule(arr)
+        print("✓ Cache hit: memory-mapped .npy without parsing JSON")
+
+    def test_stale_cache_is_rebuilt(self):
+        """Test that a cache older than the JSON is ignored and replaced."""
+        viz.load_schedule(self.path)
+        json_mtime = os.path.getmtime(self.path)
+        os.utime(self.cache, (json_mtime - 10, json_mtime - 10))
+        with mock.patch.object(viz, 'load_data', wraps=viz.load_data) as load_data:
+            arr = viz.load_schedule(self.path)
+        load_data.assert_called_once_with(self.path)
+        self.assertSchedule(arr)
+        self.assertGreaterEqual(os.path.getmtime(self.cache), json_mtime)
+        print("✓ Stale cache: rebuilt from JSON")
+
+    def test_corrupt_cache_is_rebuilt(self):
+        """Test that empty, truncated or foreign caches count as misses."""
+        viz.load_schedule(self.path)
+        with open(self.cache, 'rb') as f:
+            good = f.read()
+        wrong_dtype = os.path.join(self.tmp.name, 'wrong.npy')
+        np.save(wrong_dtype, np.zeros(2), allow_pickle=False)
+        with open(wrong_dtype, 'rb') as f:
+            foreign = f.read()
+
+        for contents in (b'', good[:20], good[:len(good) // 2], foreign):
+            with open(self.cache, 'wb') as f:
+                f.write(contents)
+            self.assertSchedule(viz.load_schedule(self.path))
+            self.assertSchedule(viz.load_schedule(self.path))
+        print("✓ Corrupt cache: rebuilt from JSON")
+
+    def test_json_fallback_matches_orjson(self):
+        """Test that load_data parses the same data with and without orjson."""
+        with mock.patch.object(viz, 'orjson', None):
+            data = viz.load_data(self.path)
+        self.assertEqual(data, {'halving_schedule': SCHEDULE})
+        if viz.orjson is not None:
+            self.assertEqual(viz.load_data(self.path), data)
+        print("✓ load_data: stdlib json fallback matches")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
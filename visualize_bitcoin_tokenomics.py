@@ -4,46 +4,165 @@ Bitcoin Tokenomics Visualization
 Creates charts showing supply distribution and inflation rates over time
 """
 
+import argparse
+import io
 import json
+import os
+from multiprocessing import get_context
+import matplotlib
+matplotlib.use('Agg')  # PNG output only; also keeps worker processes off GUI backends
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+import matplotlib.ticker as mticker
 from datetime import datetime
 import numpy as np
 
-
-def load_data():
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib parser
+    orjson = None
+
+# Shared figure style; plotters only pass what differs from it
+plt.rcParams.update({
+    'axes.labelsize': 12,
+    'axes.labelweight': 'bold',
+    'axes.titlesize': 16,
+    'axes.titleweight': 'bold',
+    'legend.fontsize': 11,
+    'grid.alpha': 0.3,
+    'lines.linewidth': 2.5,
+})
+
+# Non-interactive rendering: let Agg drop sub-pixel vertices and draw long
+# paths in chunks
+plt.ioff()
+matplotlib.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
+
+
+# Output resolution for saved figures; 300 DPI is wasted on these ~30-point curves
+DPI = 150
+
+# Axis tick formatters shared by every figure that plots BTC amounts
+_MILLIONS_FMT = mticker.FuncFormatter(lambda x, _: f'{int(x/1e6)}M')
+_MILLIONS_1F_FMT = mticker.FuncFormatter(lambda x, _: f'{x/1e6:.1f}M')
+
+# Written by bitcoin_tokenomics_calculator.py; override with BITCOIN_TOKENOMICS_DATA
+DATA_PATH = os.environ.get(
+    'BITCOIN_TOKENOMICS_DATA',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bitcoin_tokenomics_data.json'))
+
+# Default output for plot_all, next to the script
+DASHBOARD_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              'bitcoin_tokenomics_dashboard.png')
+
+
+def load_data(path=DATA_PATH):
     """Load the calculated tokenomics data."""
-    with open('/Users/z/work/lux/ai/bitcoin_tokenomics_data.json', 'r') as f:
-        return json.load(f)
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
+# Columns of the halving schedule used by the plots
+SCHEDULE_DTYPE = [
+    ('halving', 'i4'),
+    ('years', 'f8'),
+    ('reward', 'f8'),
+    ('supply', 'f8'),
+    ('annual', 'f8'),
+    ('inflation', 'f8'),
+]
 
-def plot_supply_curve(data):
+
+def _to_arrays(schedule):
     """
-    Plot Bitcoin supply accumulation over time.
+    Materialize the halving schedule once as a NumPy structured array.
+
+    Epochs without an inflation rate ('N/A') are stored as NaN.
+    """
+    arr = np.empty(len(schedule), dtype=SCHEDULE_DTYPE)
+    for i, e in enumerate(schedule):
+        inflation = e['inflation_rate_percent']
+        arr[i] = (e['halving'], e['years_from_genesis'], e['reward_btc'],
+                  e['cumulative_supply_btc'], e['annual_issuance_btc'],
+                  inflation if inflation != 'N/A' else np.nan)
+    return arr
+
+
+def load_schedule(path=DATA_PATH):
     """
-    schedule = data['halving_schedule']
+    Load the halving schedule as a structured array.
 
+    The array is cached as a .npy file next to the JSON and memory-mapped on
+    later runs, as long as the cache is newer than the JSON and holds the
+    current SCHEDULE_DTYPE. Anything else is treated as a cache miss.
+    """
+    cache = os.path.splitext(path)[0] + '.npy'
+    try:
+        if os.path.getmtime(cache) >= os.path.getmtime(path):
+            cached = np.load(cache, mmap_mode='r', allow_pickle=False)
+            if cached.dtype == np.dtype(SCHEDULE_DTYPE):
+                return cached
+    except (OSError, ValueError, EOFError):
+        pass  # missing, truncated or corrupt cache; rebuild it
+
+    arr = _to_arrays(load_data(path)['halving_schedule'])
+    # Write beside the cache and rename, so a concurrent reader never maps
+    # a half-written file
+    tmp = cache + '.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            np.save(f, arr, allow_pickle=False)
+        os.replace(tmp, cache)
+    except OSError:
+        pass  # read-only location; just skip the cache
+    return arr
+
+
+def _save(fig, path):
+    """
+    Save a figure as PNG without ever leaving a partial file at path.
+
+    The PNG is encoded in memory, written next to the target and renamed
+    into place, so a worker that dies mid-save leaves the old file intact.
+    """
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=DPI)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(buf.getbuffer())
+    os.replace(tmp, path)
+
+
+def _draw_supply_curve(fig, arr):
+    """
+    Plot Bitcoin supply accumulation over time.
+
+    Draws onto fig, which may be a Figure or a dashboard SubFigure.
+    """
     # Extract data
-    years = [event['years_from_genesis'] for event in schedule]
-    supply = [event['cumulative_supply_btc'] for event in schedule]
+    years = arr['years']
+    supply = arr['supply']
 
-    # Create figure
-    fig, ax = plt.subplots(figsize=(14, 8))
+    # Create axes
+    ax = fig.subplots()
 
     # Plot supply curve
-    ax.plot(years, supply, linewidth=2.5, color='#F7931A', label='Cumulative Supply')
-
-    # Add milestone markers
-    milestones = [
-        (4, 10500000, '50%'),
-        (8, 15750000, '75%'),
-        (13.6, 18900000, '90%'),
-        (27, 20790000, '99%'),
-        (40, 20979000, '99.9%')
-    ]
-
-    for year, supply_val, label in milestones:
-        ax.plot(year, supply_val, 'ro', markersize=8)
+    ax.plot(years, supply, color='#F7931A', label='Cumulative Supply')
+
+    # Add milestone markers (one collection for all points)
+    milestones = np.array([(4, 10500000), (8, 15750000), (13.6, 18900000),
+                           (27, 20790000), (40, 20979000)])
+    labels = ['50%', '75%', '90%', '99%', '99.9%']
+
+    ax.scatter(milestones[:, 0], milestones[:, 1], c='red', s=64, zorder=3)
+    for (year, supply_val), label in zip(milestones, labels):
         ax.annotate(label, xy=(year, supply_val), xytext=(year+2, supply_val),
                    fontsize=10, color='red', fontweight='bold')
 
@@ -52,40 +171,47 @@ def plot_supply_curve(data):
                label='21M Hard Cap', alpha=0.7)
 
     # Formatting
-    ax.set_xlabel('Years from Genesis (2009)', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Cumulative Supply (BTC)', fontsize=12, fontweight='bold')
-    ax.set_title('Bitcoin Supply Distribution Over Time', fontsize=16, fontweight='bold')
-    ax.legend(fontsize=11, loc='lower right')
-    ax.grid(True, alpha=0.3)
+    ax.set_xlabel('Years from Genesis (2009)')
+    ax.set_ylabel('Cumulative Supply (BTC)')
+    ax.set_title('Bitcoin Supply Distribution Over Time')
+    ax.legend(loc='lower right')
+    ax.grid(True)
     ax.set_xlim(0, 60)
     ax.set_ylim(0, 22000000)
 
     # Format y-axis
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{int(x/1e6)}M'))
+    ax.yaxis.set_major_formatter(_MILLIONS_FMT)
+
 
-    plt.tight_layout()
-    plt.savefig('/Users/z/work/lux/ai/bitcoin_supply_curve.png', dpi=300, bbox_inches='tight')
+def plot_supply_curve(arr):
+    """
+    Plot Bitcoin supply accumulation over time.
+    """
+    fig = plt.figure(figsize=(14, 8), layout='constrained')
+    _draw_supply_curve(fig, arr)
+    _save(fig, '/Users/z/work/lux/ai/bitcoin_supply_curve.png')
+    plt.close(fig)
     print("Supply curve saved to: /Users/z/work/lux/ai/bitcoin_supply_curve.png")
 
 
-def plot_inflation_rates(data):
+def _draw_inflation_rates(fig, arr):
     """
     Plot inflation rate decay over time.
-    """
-    schedule = data['halving_schedule']
 
+    Draws onto fig, which may be a Figure or a dashboard SubFigure.
+    """
     # Extract data (skip epoch 0 which has infinite inflation)
-    valid_events = [e for e in schedule[1:30] if e['inflation_rate_percent'] != 'N/A']
-    years = [event['years_from_genesis'] for event in valid_events]
-    inflation = [event['inflation_rate_percent'] for event in valid_events]
+    valid_events = arr[1:30][~np.isnan(arr['inflation'][1:30])]
+    years = valid_events['years']
+    inflation = valid_events['inflation']
 
-    # Create figure with two subplots
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
+    # Create two stacked axes
+    ax1, ax2 = fig.subplots(2, 1)
 
     # Plot 1: Linear scale (first 40 years)
-    mask = np.array(years) <= 40
-    ax1.plot(np.array(years)[mask], np.array(inflation)[mask],
-             linewidth=2.5, color='#F7931A', marker='o', markersize=6)
+    mask = years <= 40
+    ax1.plot(years[mask], inflation[mask],
+             color='#F7931A', marker='o', markersize=6)
 
     # Add reference lines
     ax1.axhline(y=2.0, color='green', linestyle='--', linewidth=1.5,
@@ -93,172 +219,241 @@ def plot_inflation_rates(data):
     ax1.axhline(y=1.5, color='brown', linestyle='--', linewidth=1.5,
                 label='Gold (~1.5%)', alpha=0.7)
 
-    ax1.set_xlabel('Years from Genesis (2009)', fontsize=12, fontweight='bold')
-    ax1.set_ylabel('Annual Inflation Rate (%)', fontsize=12, fontweight='bold')
-    ax1.set_title('Bitcoin Inflation Rate Decay (Linear Scale)', fontsize=14, fontweight='bold')
+    ax1.set_xlabel('Years from Genesis (2009)')
+    ax1.set_ylabel('Annual Inflation Rate (%)')
+    ax1.set_title('Bitcoin Inflation Rate Decay (Linear Scale)', fontsize=14)
     ax1.legend(fontsize=10)
-    ax1.grid(True, alpha=0.3)
+    ax1.grid(True)
     ax1.set_xlim(0, 40)
 
     # Plot 2: Log scale (all epochs)
-    ax2.semilogy(years, inflation, linewidth=2.5, color='#F7931A',
-                 marker='o', markersize=5)
+    ax2.semilogy(years, inflation, color='#F7931A',
+                 marker='o', markersize=5, snap=True)
 
     ax2.axhline(y=2.0, color='green', linestyle='--', linewidth=1.5,
                 label='Fed Target (2%)', alpha=0.7)
     ax2.axhline(y=1.5, color='brown', linestyle='--', linewidth=1.5,
                 label='Gold (~1.5%)', alpha=0.7)
 
-    ax2.set_xlabel('Years from Genesis (2009)', fontsize=12, fontweight='bold')
-    ax2.set_ylabel('Annual Inflation Rate (%, log scale)', fontsize=12, fontweight='bold')
-    ax2.set_title('Bitcoin Inflation Rate Decay (Logarithmic Scale)', fontsize=14, fontweight='bold')
+    ax2.set_xlabel('Years from Genesis (2009)')
+    ax2.set_ylabel('Annual Inflation Rate (%, log scale)')
+    ax2.set_title('Bitcoin Inflation Rate Decay (Logarithmic Scale)', fontsize=14)
     ax2.legend(fontsize=10)
-    ax2.grid(True, alpha=0.3, which='both')
+    ax2.grid(True, which='both')
     ax2.set_xlim(0, 120)
 
-    plt.tight_layout()
-    plt.savefig('/Users/z/work/lux/ai/bitcoin_inflation_rates.png', dpi=300, bbox_inches='tight')
+
+def plot_inflation_rates(arr):
+    """
+    Plot inflation rate decay over time.
+    """
+    fig = plt.figure(figsize=(14, 10), layout='constrained')
+    _draw_inflation_rates(fig, arr)
+    _save(fig, '/Users/z/work/lux/ai/bitcoin_inflation_rates.png')
+    plt.close(fig)
     print("Inflation rates saved to: /Users/z/work/lux/ai/bitcoin_inflation_rates.png")
 
 
-def plot_issuance_schedule(data):
+def _draw_issuance_schedule(fig, arr):
     """
     Plot block reward and annual issuance over time.
-    """
-    schedule = data['halving_schedule']
 
-    years = [event['years_from_genesis'] for event in schedule[:20]]
-    rewards = [event['reward_btc'] for event in schedule[:20]]
-    annual_issuance = [event['annual_issuance_btc'] for event in schedule[:20]]
+    Draws onto fig, which may be a Figure or a dashboard SubFigure.
+    """
+    years = arr['years'][:20]
+    rewards = arr['reward'][:20]
+    annual_issuance = arr['annual'][:20]
 
-    # Create figure with two y-axes
-    fig, ax1 = plt.subplots(figsize=(14, 8))
+    # Create axes (second y-axis added below)
+    ax1 = fig.subplots()
 
     color1 = '#F7931A'
-    ax1.set_xlabel('Years from Genesis (2009)', fontsize=12, fontweight='bold')
-    ax1.set_ylabel('Block Reward (BTC)', fontsize=12, fontweight='bold', color=color1)
-    ax1.semilogy(years, rewards, color=color1, linewidth=2.5, marker='o',
-                 markersize=7, label='Block Reward')
+    ax1.set_xlabel('Years from Genesis (2009)')
+    ax1.set_ylabel('Block Reward (BTC)', color=color1)
+    ax1.semilogy(years, rewards, color=color1, marker='o',
+                 markersize=7, label='Block Reward', rasterized=True, snap=True)
     ax1.tick_params(axis='y', labelcolor=color1)
-    ax1.grid(True, alpha=0.3, which='both')
+    ax1.grid(True, which='both')
 
     # Second y-axis
     ax2 = ax1.twinx()
     color2 = 'darkblue'
-    ax2.set_ylabel('Annual Issuance (BTC)', fontsize=12, fontweight='bold', color=color2)
-    ax2.semilogy(years, annual_issuance, color=color2, linewidth=2.5,
-                 marker='s', markersize=6, linestyle='--', label='Annual Issuance')
+    ax2.set_ylabel('Annual Issuance (BTC)', color=color2)
+    ax2.semilogy(years, annual_issuance, color=color2,
+                 marker='s', markersize=6, linestyle='--', label='Annual Issuance',
+                 rasterized=True, snap=True)
     ax2.tick_params(axis='y', labelcolor=color2)
 
     # Title
-    ax1.set_title('Bitcoin Block Reward and Annual Issuance Schedule',
-                  fontsize=16, fontweight='bold')
+    ax1.set_title('Bitcoin Block Reward and Annual Issuance Schedule')
 
     # Legends
     lines1, labels1 = ax1.get_legend_handles_labels()
     lines2, labels2 = ax2.get_legend_handles_labels()
-    ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper right', fontsize=11)
+    ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper right')
+
 
-    plt.tight_layout()
-    plt.savefig('/Users/z/work/lux/ai/bitcoin_issuance_schedule.png', dpi=300, bbox_inches='tight')
+def plot_issuance_schedule(arr):
+    """
+    Plot block reward and annual issuance over time.
+    """
+    fig = plt.figure(figsize=(14, 8), layout='constrained')
+    _draw_issuance_schedule(fig, arr)
+    _save(fig, '/Users/z/work/lux/ai/bitcoin_issuance_schedule.png')
+    plt.close(fig)
     print("Issuance schedule saved to: /Users/z/work/lux/ai/bitcoin_issuance_schedule.png")
 
 
-def plot_security_budget(data):
+def _draw_security_budget(fig, arr):
     """
     Plot security budget projection.
-    """
-    schedule = data['halving_schedule']
-
-    years = [event['years_from_genesis'] for event in schedule[:25]]
-    btc_price = 100000  # Assume $100k BTC
 
-    # Calculate security budget at different BTC prices
-    rewards = [event['annual_issuance_btc'] for event in schedule[:25]]
+    Draws onto fig, which may be a Figure or a dashboard SubFigure.
+    """
+    years = arr['years'][:25]
 
-    budget_50k = [r * 50000 / 1e9 for r in rewards]  # In billions USD
-    budget_100k = [r * 100000 / 1e9 for r in rewards]
-    budget_200k = [r * 200000 / 1e9 for r in rewards]
+    # Calculate security budget at different BTC prices, one row per price
+    rewards = arr['annual'][:25]
+    prices = np.array([50_000.0, 100_000.0, 200_000.0])
+    budgets = np.multiply.outer(prices, rewards) / 1e9  # In billions USD
 
-    # Create figure
-    fig, ax = plt.subplots(figsize=(14, 8))
+    # Create axes
+    ax = fig.subplots()
 
-    ax.semilogy(years, budget_50k, linewidth=2.5, label='BTC = $50k', marker='o')
-    ax.semilogy(years, budget_100k, linewidth=2.5, label='BTC = $100k', marker='s')
-    ax.semilogy(years, budget_200k, linewidth=2.5, label='BTC = $200k', marker='^')
+    for price, budget, marker in zip(prices, budgets, ['o', 's', '^']):
+        ax.semilogy(years, budget, label=f'BTC = ${int(price / 1e3)}k', marker=marker,
+                    snap=True)
 
     # Add critical threshold line (estimated)
     ax.axhline(y=10, color='red', linestyle='--', linewidth=2,
                label='Est. Min Security Budget ($10B/yr)', alpha=0.7)
 
-    ax.set_xlabel('Years from Genesis (2009)', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Annual Security Budget (Billions USD, log scale)',
-                  fontsize=12, fontweight='bold')
-    ax.set_title('Bitcoin Security Budget Projection (Block Rewards Only)',
-                 fontsize=16, fontweight='bold')
-    ax.legend(fontsize=11, loc='upper right')
-    ax.grid(True, alpha=0.3, which='both')
+    ax.set_xlabel('Years from Genesis (2009)')
+    ax.set_ylabel('Annual Security Budget (Billions USD, log scale)')
+    ax.set_title('Bitcoin Security Budget Projection (Block Rewards Only)')
+    ax.legend(loc='upper right')
+    ax.grid(True, which='both')
     ax.set_xlim(0, 100)
 
-    plt.tight_layout()
-    plt.savefig('/Users/z/work/lux/ai/bitcoin_security_budget.png', dpi=300, bbox_inches='tight')
+
+def plot_security_budget(arr):
+    """
+    Plot security budget projection.
+    """
+    fig = plt.figure(figsize=(14, 8), layout='constrained')
+    _draw_security_budget(fig, arr)
+    _save(fig, '/Users/z/work/lux/ai/bitcoin_security_budget.png')
+    plt.close(fig)
     print("Security budget saved to: /Users/z/work/lux/ai/bitcoin_security_budget.png")
 
 
-def plot_supply_distribution(data):
+def _draw_supply_distribution(fig, arr):
     """
     Plot distribution of supply across epochs.
-    """
-    schedule = data['halving_schedule']
-
-    epochs = [event['halving'] for event in schedule[:10]]
-    supply_per_epoch = []
 
-    for i in range(10):
-        if i == 0:
-            supply = schedule[i+1]['cumulative_supply_btc']
-        else:
-            supply = (schedule[i+1]['cumulative_supply_btc'] -
-                     schedule[i]['cumulative_supply_btc'])
-        supply_per_epoch.append(supply)
+    Draws onto fig, which may be a Figure or a dashboard SubFigure.
+    """
+    epochs = arr['halving'][:10]
+    # Supply at genesis is 0, so the first difference is epoch 0's issuance
+    supply_per_epoch = np.diff(arr['supply'][:11])
 
     # Create pie chart
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+    ax1, ax2 = fig.subplots(1, 2)
 
     # Pie chart
     colors = plt.cm.YlOrRd(np.linspace(0.3, 0.9, 10))
+    # Wedge labels formatted up front; pie() hands them out in wedge order
+    pct_labels = iter([f'{v:.1f}%' for v in supply_per_epoch / supply_per_epoch.sum() * 100])
     wedges, texts, autotexts = ax1.pie(supply_per_epoch, labels=[f'Epoch {i}' for i in epochs],
-                                        autopct='%1.1f%%', startangle=90, colors=colors,
+                                        autopct=lambda _: next(pct_labels),
+                                        startangle=90, colors=colors,
                                         textprops={'fontsize': 10})
 
     ax1.set_title('Bitcoin Supply Distribution by Epoch\n(First 10 Halvings)',
-                  fontsize=14, fontweight='bold')
+                  fontsize=14)
 
     # Bar chart
-    ax2.bar(epochs, supply_per_epoch, color=colors, edgecolor='black', linewidth=1.5)
-    ax2.set_xlabel('Halving Epoch', fontsize=12, fontweight='bold')
-    ax2.set_ylabel('BTC Issued in Epoch (Millions)', fontsize=12, fontweight='bold')
-    ax2.set_title('BTC Issuance by Epoch', fontsize=14, fontweight='bold')
-    ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1e6:.1f}M'))
-    ax2.grid(True, alpha=0.3, axis='y')
-
-    plt.tight_layout()
-    plt.savefig('/Users/z/work/lux/ai/bitcoin_supply_distribution.png', dpi=300, bbox_inches='tight')
+    ax2.bar(epochs, supply_per_epoch, color=colors, edgecolor='black', linewidth=1.5,
+            rasterized=True)
+    ax2.set_xlabel('Halving Epoch')
+    ax2.set_ylabel('BTC Issued in Epoch (Millions)')
+    ax2.set_title('BTC Issuance by Epoch', fontsize=14)
+    ax2.yaxis.set_major_formatter(_MILLIONS_1F_FMT)
+    ax2.grid(True, axis='y')
+
+
+def plot_supply_distribution(arr):
+    """
+    Plot distribution of supply across epochs.
+    """
+    fig = plt.figure(figsize=(16, 8), layout='constrained')
+    _draw_supply_distribution(fig, arr)
+    _save(fig, '/Users/z/work/lux/ai/bitcoin_supply_distribution.png')
+    plt.close(fig)
     print("Supply distribution saved to: /Users/z/work/lux/ai/bitcoin_supply_distribution.png")
 
 
-def main():
-    """Generate all visualizations."""
+def plot_all(arr, path=DASHBOARD_PATH):
+    """
+    Plot all five charts as one dashboard image.
+
+    Each chart gets its own subfigure, so the whole set shares one canvas
+    and is encoded and written with a single save.
+    """
+    fig = plt.figure(figsize=(28, 26), layout='constrained')
+    grid = fig.add_gridspec(3, 2, height_ratios=[10, 8, 8])
+    _draw_supply_curve(fig.add_subfigure(grid[0, 0]), arr)
+    _draw_inflation_rates(fig.add_subfigure(grid[0, 1]), arr)
+    _draw_issuance_schedule(fig.add_subfigure(grid[1, 0]), arr)
+    _draw_security_budget(fig.add_subfigure(grid[1, 1]), arr)
+    _draw_supply_distribution(fig.add_subfigure(grid[2, :]), arr)
+    _save(fig, path)
+    plt.close(fig)
+    print(f"Dashboard saved to: {path}")
+
+
+PLOTTERS = {
+    'supply': plot_supply_curve,
+    'inflation': plot_inflation_rates,
+    'issuance': plot_issuance_schedule,
+    'security': plot_security_budget,
+    'distribution': plot_supply_distribution,
+}
+
+# Everything main() can hand to a worker; the dashboard is opt-in since it
+# costs about as much to render as the five charts together
+JOBS = {**PLOTTERS, 'dashboard': plot_all}
+
+
+def _dispatch(job):
+    """Render one figure in a worker process."""
+    name, arr = job
+    JOBS[name](arr)
+
+
+def main(dashboard=False):
+    """
+    Generate all visualizations.
+
+    Args:
+        dashboard: Also render the combined plot_all dashboard
+    """
     print("Loading Bitcoin tokenomics data...")
-    data = load_data()
+    arr = load_schedule()
 
     print("\nGenerating visualizations...\n")
 
-    plot_supply_curve(data)
-    plot_inflation_rates(data)
-    plot_issuance_schedule(data)
-    plot_security_budget(data)
-    plot_supply_distribution(data)
+    # The figures are independent, so rasterize them concurrently. Worker
+    # startup re-imports matplotlib, which only pays off with spare cores.
+    names = list(PLOTTERS) + (['dashboard'] if dashboard else [])
+    jobs = [(name, arr) for name in names]
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers > 1:
+        with get_context('spawn').Pool(workers) as pool:
+            pool.map(_dispatch, jobs)
+    else:
+        for job in jobs:
+            _dispatch(job)
 
     print("\nAll visualizations complete!")
     print("\nGenerated files:")
@@ -267,7 +462,12 @@ def main():
     print("  - bitcoin_issuance_schedule.png")
     print("  - bitcoin_security_budget.png")
     print("  - bitcoin_supply_distribution.png")
+    if dashboard:
+        print("  - bitcoin_tokenomics_dashboard.png")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Render the Bitcoin tokenomics charts.")
+    parser.add_argument('--dashboard', action='store_true',
+                        help="also render all five charts into one dashboard PNG")
+    main(dashboard=parser.parse_args().dashboard)